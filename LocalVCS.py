@@ -6,14 +6,48 @@ import datetime
 import threading
 import json
 import hashlib
+import contextlib
+import difflib
+import io
+import itertools
+import collections
+import tempfile
+import mmap
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QLabel, QPushButton, QLineEdit,
-                            QComboBox, QProgressBar, QScrollArea, QFrame,
+                            QComboBox, QProgressBar,
                             QFileDialog, QMessageBox, QGroupBox, QGridLayout,
-                            QTextEdit, QTabWidget, QSplitter, QSizePolicy, QDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QPalette, QColor, QPixmap, QIcon
+                            QTextEdit, QTabWidget, QSplitter, QSizePolicy, QDialog,
+                            QListView, QStyledItemDelegate)
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QTimer, QAbstractListModel,
+                          QModelIndex, QEvent, QRect, QSize, QObject, QRunnable,
+                          QThreadPool)
+from PyQt5.QtGui import QFont, QPalette, QColor, QPixmap, QIcon, QPainter, QFontMetrics
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # C implementation of SequenceMatcher, picked up by difflib.unified_diff
+    from cdifflib import CSequenceMatcher
+    difflib.SequenceMatcher = CSequenceMatcher
+except ImportError:
+    pass
 
 
 """
@@ -28,146 +62,688 @@ License: MIT License
 Version: 1.0
 """
 
+# Hash algorithm recorded in each backup's hash file; BLAKE3 when available
+HASH_ALGO = 'blake3' if blake3 is not None else 'md5'
+
+# Read size used when streaming file contents
+CHUNK_SIZE = 1 << 20
+
+# Deflate level for backup archives; level 1 is several times faster than
+# the zlib default at a small cost in archive size
+COMPRESS_LEVEL = 1
+
+# Already-compressed formats that are stored in backups without deflating
+STORED_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp3', '.mp4', '.m4a', '.mov',
+    '.mkv', '.avi', '.ogg', '.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst',
+    '.7z', '.rar', '.pdf'
+})
+
+# Hash data stored inside each backup zip
+MANIFEST_NAME = '.localvcs/hashes.json'
+
+# Manifests larger than this are parsed incrementally when ijson is installed
+STREAM_JSON_SIZE = 32 << 20
+
+# Files larger than this only show their first differing line in diffs
+DIFF_MAX_SIZE = 2 << 20
+
+# Number of files processed between progress signals
+PROGRESS_INTERVAL = 256
+
+# Per-target cache of file hashes keyed by path, size and modification time
+HASH_CACHE_NAME = '.localvcs_cache.json'
+
+# Bytes read from the start of a zip member to tell text from binary
+SNIFF_SIZE = 8192
+
+# Returned by _diff_one for members that look binary
+BINARY_DIFF = object()
+
+# Application stylesheet, set once at startup
+GLOBAL_QSS = """
+    QMainWindow {
+        background-color: #f8f9fa;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #dee2e6;
+        border-radius: 8px;
+        margin-top: 1ex;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #2c3e50;
+    }
+    QPushButton {
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+        font-size: 10px;
+    }
+    QPushButton[class="primary"] {
+        background-color: #3498db;
+        color: black;
+    }
+    QPushButton[class="primary"]:hover {
+        background-color: #2980b9;
+    }
+    QPushButton[class="secondary"] {
+        background-color: #95a5a6;
+        color: black;
+    }
+    QPushButton[class="secondary"]:hover {
+        background-color: #7f8c8d;
+    }
+    QPushButton[class="danger"] {
+        background-color: #e74c3c;
+        color: black;
+    }
+    QPushButton[class="danger"]:hover {
+        background-color: #c0392b;
+    }
+    QLineEdit {
+        border: 2px solid #dee2e6;
+        border-radius: 6px;
+        padding: 8px;
+        background-color: white;
+    }
+    QLineEdit:focus {
+        border-color: #3498db;
+    }
+    QComboBox {
+        border: 2px solid #dee2e6;
+        border-radius: 6px;
+        padding: 8px;
+        background-color: white;
+    }
+    QComboBox:focus {
+        border-color: #3498db;
+    }
+    QProgressBar {
+        border: 2px solid #dee2e6;
+        border-radius: 6px;
+        text-align: center;
+        background-color: #e9ecef;
+    }
+    QProgressBar::chunk {
+        background-color: #3498db;
+        border-radius: 4px;
+    }
+    QLabel[class="heading"] {
+        color: #2c3e50;
+        margin-bottom: 20px;
+    }
+    QLabel[class="hint"] {
+        color: #7f8c8d;
+        font-size: 12px;
+    }
+    QLabel#comparisonPlaceholder {
+        color: #7f8c8d;
+        font-size: 16px;
+        text-align: center;
+        padding: 40px;
+    }
+    QLabel#comparisonSummary {
+        font-weight: bold;
+        font-size: 14px;
+        padding: 10px;
+        background-color: #ecf0f1;
+        border-radius: 4px;
+        color: #2c3e50;
+    }
+    QTabWidget#mainTabs::pane {
+        border: 2px solid #bdc3c7;
+        border-radius: 8px;
+        background-color: #f8f9fa;
+    }
+    QTabWidget#mainTabs > QTabBar::tab {
+        background-color: #bdc3c7;
+        color: #2c3e50;
+        padding: 8px 24px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        font-weight: bold;
+        min-width: 120px;
+    }
+    QTabWidget#mainTabs > QTabBar::tab:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QTabWidget#mainTabs > QTabBar::tab:hover {
+        background-color: #95a5a6;
+    }
+    QTabWidget#resultsTabs::pane {
+        border: 2px solid #bdc3c7;
+        border-radius: 6px;
+        background-color: white;
+    }
+    QTabWidget#resultsTabs > QTabBar::tab {
+        background-color: #ecf0f1;
+        color: #2c3e50;
+        padding: 6px 16px;
+        margin-right: 1px;
+        border-top-left-radius: 3px;
+        border-top-right-radius: 3px;
+        font-weight: bold;
+        font-size: 11px;
+        min-width: 100px;
+    }
+    QTabWidget#resultsTabs > QTabBar::tab:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QTabWidget#resultsTabs > QTabBar::tab:hover {
+        background-color: #bdc3c7;
+    }
+    QListView#backupsList {
+        border: none;
+        background-color: #f8f9fa;
+        padding: 5px;
+    }
+    QTextEdit[class="results"] {
+        border: none;
+        background-color: white;
+        color: #2c3e50;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 13px;
+        padding: 10px;
+    }
+    QLabel#notesTitle {
+        font-size: 14px;
+        font-weight: bold;
+        color: #2c3e50;
+        margin-bottom: 10px;
+    }
+    QTextEdit#notesEdit {
+        border: 2px solid #bdc3c7;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 12px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    QTextEdit#notesEdit:focus {
+        border-color: #3498db;
+    }
+"""
+
+# Timestamp in backup names, BACKUP_<timestamp>.zip
+BACKUP_TIME_FORMAT = "%m_%d_%Y_%H_%M_%S"
+
+# Number of backup zips kept open between comparisons
+ZIP_POOL_SIZE = 4
+
+# Per-thread read buffer for calculate_file_hash
+_hash_local = threading.local()
+
+
+def loads_json(data):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data, indent=None):
+    """Serialize data to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=indent).encode('utf-8')
+
+
+def load_json(path):
+    """Read a JSON file"""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def save_json(path, data, indent=None):
+    """Write a JSON file"""
+    with open(path, 'wb') as f:
+        f.write(dumps_json(data, indent))
+
+
+def parse_manifest(f, size):
+    """Parse hash data from a binary file, streaming it with ijson if it is large"""
+    if ijson is not None and size > STREAM_JSON_SIZE:
+        # Builds each top-level value from parser events without first
+        # holding the whole document in memory
+        return dict(ijson.kvitems(f, '', use_float=True))
+    return loads_json(f.read())
+
+
+def read_manifest(backup_path, file_exists=os.path.exists):
+    """Load a backup's hash data from its zip, or from an older _hashes.json file"""
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        try:
+            info = zipf.getinfo(MANIFEST_NAME)
+        except KeyError:
+            info = None
+        if info is not None:
+            with zipf.open(info) as f:
+                return parse_manifest(f, info.file_size)
+
+    hash_file_path = backup_path.replace('.zip', '_hashes.json')
+    if file_exists(hash_file_path):
+        with open(hash_file_path, 'rb') as f:
+            return parse_manifest(f, os.fstat(f.fileno()).st_size)
+    return None
+
+
+def read_backup_source(backup_path, file_exists=os.path.exists):
+    """Get the source directory of a backup from its _source.txt file or hash data"""
+    source_file_path = backup_path.replace('.zip', '_source.txt')
+    if file_exists(source_file_path):
+        with open(source_file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    hash_data = read_manifest(backup_path, file_exists)
+    return hash_data.get('source_directory', '') if hash_data else ''
+
+
+def read_backup_notes(backup_path, file_exists=os.path.exists):
+    """Read the notes saved next to a backup, or '' if it has none"""
+    notes_file_path = backup_path.replace('.zip', '_notes.txt')
+    if file_exists(notes_file_path):
+        with open(notes_file_path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    return ''
+
+
+def ellipsize_path(path, limit):
+    """Shorten a path to its last characters, marking the cut with ..."""
+    return path if len(path) <= limit else "..." + path[-(limit - 3):]
+
+
+def truncate_text(text, limit):
+    """Shorten text to its first characters, marking the cut with ..."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def backup_timestamp(backup_name):
+    """Parse the creation time from a BACKUP_<timestamp>.zip name, or datetime.min"""
+    try:
+        return datetime.datetime.strptime(backup_name[7:-4], BACKUP_TIME_FORMAT)
+    except ValueError:
+        return datetime.datetime.min
+
+
+def format_size(size_bytes):
+    """Format file size in human readable format"""
+    if size_bytes == 0:
+        return "0B"
+    size_names = ["B", "KB", "MB", "GB", "TB"]
+    i = 0
+    while size_bytes >= 1024 and i < len(size_names) - 1:
+        size_bytes /= 1024.0
+        i += 1
+    return f"{size_bytes:.1f}{size_names[i]}"
+
+
+def fadvise(f, advice):
+    """Pass an access pattern hint for an open file to the kernel where supported"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, advice)
+        except OSError:
+            pass
+
+
+@contextlib.contextmanager
+def open_sequential(file_path, buffering=-1):
+    """Open a file for one sequential read with read-ahead and cache-drop hints"""
+    # O_SEQUENTIAL maps to FILE_FLAG_SEQUENTIAL_SCAN on Windows
+    flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+    with open(os.open(file_path, flags), 'rb', buffering=buffering) as f:
+        fadvise(f, getattr(os, 'POSIX_FADV_SEQUENTIAL', 0))
+        try:
+            yield f
+        finally:
+            fadvise(f, getattr(os, 'POSIX_FADV_DONTNEED', 0))
+
+
+def iter_files(root):
+    """Yield (path, relative path) for every file under root using os.scandir"""
+    stack = [(root, '')]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                rel_path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path + os.sep))
+                elif entry.is_file():
+                    yield entry.path, rel_path
+
+
+def get_compress_type(file_path):
+    """Pick ZIP_STORED for already-compressed files and ZIP_DEFLATED otherwise"""
+    if os.path.splitext(file_path)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def new_hasher():
+    """Create a hash object for HASH_ALGO"""
+    return blake3() if blake3 is not None else hashlib.md5()
+
+
+def calculate_file_hash(file_path):
+    """Calculate BLAKE3 hash of a file (MD5 if blake3 is not installed)"""
+    try:
+        hasher = new_hasher()
+        # blake3 0.4+ maps and hashes the file itself
+        if hasattr(hasher, 'update_mmap'):
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+
+        buffer = getattr(_hash_local, 'buffer', None)
+        if buffer is None:
+            buffer = _hash_local.buffer = bytearray(CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open_sequential(file_path, buffering=0) as f:
+            # Hash large files straight from the page cache
+            if os.fstat(f.fileno()).st_size >= CHUNK_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+                return hasher.hexdigest()
+            while True:
+                n = f.readinto(view)
+                if not n:
+                    break
+                hasher.update(view[:n])
+        return hasher.hexdigest()
+    except Exception:
+        return None
+
 
 class BackupThread(QThread):
     backup_completed = pyqtSignal(str)
     backup_failed = pyqtSignal(str)
+    progress = pyqtSignal(int, int)
 
     def __init__(self, source_dir, target_dir):
         super().__init__()
         self.source_dir = source_dir
         self.target_dir = target_dir
+        # Reused read buffer for streaming files into the zip
+        self._buffer = bytearray(CHUNK_SIZE)
 
     def run(self):
         try:
             # Create timestamp for backup name
-            timestamp = datetime.datetime.now().strftime("%m_%d_%Y_%H_%M_%S")
+            timestamp = datetime.datetime.now().strftime(BACKUP_TIME_FORMAT)
             backup_name = f"BACKUP_{timestamp}"
             backup_path = os.path.join(self.target_dir, backup_name + ".zip")
 
-            # Calculate file hashes before creating zip
+            # Create zip file, hashing each file as it is written unless
+            # its size and modification time match the hash cache
+            hash_cache = self.load_hash_cache()
+            seen_hashes = {}
             file_hashes = {}
-            for root, dirs, files in os.walk(self.source_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, self.source_dir)
-                    file_hashes[rel_path] = self.calculate_file_hash(file_path)
-
-            # Create zip file
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(self.source_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, self.source_dir)
-                        zipf.write(file_path, arcname)
-
-            # Save hash information
-            hash_file_path = backup_path.replace('.zip', '_hashes.json')
-            hash_data = {
-                'backup_name': backup_name,
-                'created_at': datetime.datetime.now().isoformat(),
-                'file_hashes': file_hashes,
-                'total_files': len(file_hashes),
-                'source_directory': self.source_dir
-            }
-            with open(hash_file_path, 'w') as f:
-                json.dump(hash_data, f, indent=2)
+            files = list(iter_files(self.source_dir))
+
+            # The hash manifest is stored under MANIFEST_NAME; refuse to back up
+            # a source file at that path rather than leave it out
+            for _, arcname in files:
+                if arcname.replace(os.sep, '/') == MANIFEST_NAME:
+                    raise ValueError(
+                        f"Source directory contains {MANIFEST_NAME}, which LocalVCS "
+                        "reserves for backup metadata. Rename or move it and try again.")
+            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=COMPRESS_LEVEL) as zipf:
+                for done, (file_path, arcname) in enumerate(files):
+                    if done % PROGRESS_INTERVAL == 0:
+                        self.progress.emit(done, len(files))
+                    st = os.stat(file_path)
+                    cached = hash_cache.get(file_path)
+                    if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                        file_hash = cached[2]
+                        zipf.write(file_path, arcname,
+                                   get_compress_type(file_path))
+                    else:
+                        file_hash = self.add_file(zipf, file_path, arcname)
+                    file_hashes[arcname] = file_hash
+                    seen_hashes[file_path] = [st.st_size, st.st_mtime_ns, file_hash]
+
+                # Store hash information uncompressed inside the zip
+                hash_data = {
+                    'backup_name': backup_name,
+                    'created_at': datetime.datetime.now().isoformat(),
+                    'file_hashes': file_hashes,
+                    'total_files': len(file_hashes),
+                    'source_directory': self.source_dir,
+                    'algo': HASH_ALGO
+                }
+                zipf.writestr(MANIFEST_NAME, dumps_json(hash_data, indent=2),
+                              compress_type=zipfile.ZIP_STORED)
+            self.progress.emit(len(files), len(files))
+
+            # Record the source directory next to the backup so listing
+            # backups doesn't have to open the zip and parse its manifest
+            source_file_path = backup_path.replace('.zip', '_source.txt')
+            with open(source_file_path, 'w', encoding='utf-8') as f:
+                f.write(self.source_dir)
+
+            self.save_hash_cache(hash_cache, seen_hashes)
 
             self.backup_completed.emit(backup_path)
 
         except Exception as e:
             self.backup_failed.emit(str(e))
 
-    def calculate_file_hash(self, file_path):
-        """Calculate MD5 hash of a file"""
-        hash_md5 = hashlib.md5()
+    def load_hash_cache(self):
+        """Load cached {path: [size, mtime_ns, hash]} entries for the current algorithm"""
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            cache = load_json(os.path.join(self.target_dir, HASH_CACHE_NAME))
+            if cache.get('algo') == HASH_ALGO:
+                return cache.get('files', {})
         except Exception:
-            return None
+            pass
+        return {}
+
+    def save_hash_cache(self, hash_cache, seen_hashes):
+        """Replace this source's cache entries with the files seen in this backup"""
+        prefix = os.path.join(self.source_dir, '')
+        files = {path: entry for path, entry in hash_cache.items()
+                 if not path.startswith(prefix)}
+        files.update(seen_hashes)
+        try:
+            save_json(os.path.join(self.target_dir, HASH_CACHE_NAME),
+                      {'algo': HASH_ALGO, 'files': files})
+        except Exception as e:
+            print(f"Error saving hash cache: {e}")
+
+    def add_file(self, zipf, file_path, arcname):
+        """Write a file into the zip and return its hash, reading it only once"""
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = get_compress_type(file_path)
+        zinfo._compresslevel = COMPRESS_LEVEL
+        hasher = new_hasher()
+        view = memoryview(self._buffer)
+        with open_sequential(file_path, buffering=0) as src, zipf.open(zinfo, 'w') as dst:
+            while True:
+                n = src.readinto(view)
+                if not n:
+                    break
+                hasher.update(view[:n])
+                dst.write(view[:n])
+        return hasher.hexdigest()
 
 
 class RestoreThread(QThread):
     restore_completed = pyqtSignal(str)
     restore_failed = pyqtSignal(str)
+    progress = pyqtSignal(int, int)
 
     def __init__(self, backup_path, source_dir):
         super().__init__()
         self.backup_path = backup_path
         self.source_dir = source_dir
+        # Shared extraction progress across worker threads
+        self._progress_lock = threading.Lock()
+        self._extracted = 0
+        self._total = 0
 
     def run(self):
         try:
-            # Create temporary directory for extraction
-            temp_dir = os.path.join(os.path.dirname(
-                self.backup_path), "temp_restore")
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-            os.makedirs(temp_dir)
-
-            # Extract backup
             with zipfile.ZipFile(self.backup_path, 'r') as zipf:
-                zipf.extractall(temp_dir)
-
-            # Remove existing source directory contents
-            if os.path.exists(self.source_dir):
-                shutil.rmtree(self.source_dir)
-
-            # Move extracted contents to source directory
-            extracted_items = os.listdir(temp_dir)
-            if len(extracted_items) == 1 and os.path.isdir(os.path.join(temp_dir, extracted_items[0])):
-                # Single directory, move its contents
-                shutil.move(os.path.join(
-                    temp_dir, extracted_items[0]), self.source_dir)
-            else:
-                # Multiple items, move them directly
-                os.makedirs(self.source_dir, exist_ok=True)
-                for item in extracted_items:
-                    shutil.move(os.path.join(temp_dir, item), self.source_dir)
+                infos = [info for info in zipf.infolist()
+                         if info.filename != MANIFEST_NAME]
 
-            # Clean up temporary directory
-            shutil.rmtree(temp_dir)
+            # A backup holding a single directory restores that directory's contents
+            prefix = self.get_single_root(infos)
+
+            # Set existing source directory contents aside
+            old_dir = self.move_aside(self.source_dir)
+
+            # Extract backup straight into the source directory, putting the
+            # previous contents back if that fails
+            try:
+                os.makedirs(self.source_dir)
+                self.extract_members(infos, self.source_dir, prefix)
+            except Exception as e:
+                if old_dir:
+                    self.roll_back(old_dir, e)
+                raise
+            # Remove the holding directory made by move_aside, with the old contents
+            if old_dir:
+                shutil.rmtree(os.path.dirname(old_dir), ignore_errors=True)
 
             self.restore_completed.emit(self.source_dir)
 
         except Exception as e:
             self.restore_failed.emit(str(e))
 
+    def roll_back(self, old_dir, error):
+        """Put the contents moved aside by move_aside back in place of a failed restore"""
+        try:
+            shutil.rmtree(self.source_dir, ignore_errors=True)
+            os.rename(old_dir, self.source_dir)
+        except OSError as rollback_error:
+            raise RuntimeError(
+                f"{error}. Putting the previous contents back also failed "
+                f"({rollback_error}); they are still in {old_dir}") from error
+        try:
+            os.rmdir(os.path.dirname(old_dir))
+        except OSError:
+            pass
+
+    def move_aside(self, path):
+        """Rename path into a new sibling holding directory and return its new name,
+        or delete it if it can't be renamed"""
+        if not os.path.exists(path):
+            return None
+        # A fresh directory from mkdtemp, so nothing already there is overwritten;
+        # same parent directory, so this is a rename, not a copy
+        holder = tempfile.mkdtemp(dir=os.path.dirname(os.path.normpath(path)),
+                                  prefix='.localvcs_old_')
+        old_dir = os.path.join(holder, 'old')
+        try:
+            os.rename(path, old_dir)
+            return old_dir
+        except OSError:
+            # e.g. path is a mount point or has files open on Windows
+            os.rmdir(holder)
+            shutil.rmtree(path)
+            return None
+
+    def get_single_root(self, infos):
+        """Return 'name/' if every member is inside one top-level directory, else ''"""
+        roots = {info.filename.split('/', 1)[0] for info in infos}
+        if len(roots) == 1:
+            prefix = roots.pop() + '/'
+            if all(info.filename.startswith(prefix) for info in infos):
+                return prefix
+        return ''
+
+    def get_member_target(self, dest_dir, name):
+        """Map a member name to a path inside dest_dir, dropping unsafe components"""
+        parts = [part for part in name.split('/')
+                 if part not in ('', '.', '..') and not os.path.splitdrive(part)[0]]
+        return os.path.join(dest_dir, *parts) if parts else None
+
+    def extract_members(self, infos, dest_dir, prefix=''):
+        """Extract zip members in parallel across worker threads"""
+        members = []
+        for info in infos:
+            target = self.get_member_target(dest_dir, info.filename[len(prefix):])
+            if target is None:
+                continue
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+            else:
+                members.append((info, target))
+
+        # Create parent directories up front so workers don't race in makedirs
+        for parent in {os.path.dirname(target) for _, target in members}:
+            os.makedirs(parent, exist_ok=True)
+
+        self._extracted = 0
+        self._total = len(members)
+        workers = min(os.cpu_count() or 1, max(len(members), 1))
+        chunks = [members[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume results so worker exceptions are raised here
+            list(executor.map(self.extract_chunk, chunks))
+        self.progress.emit(self._total, self._total)
+
+        # Every worker is done with the backup, so its cached pages can go
+        with open(self.backup_path, 'rb') as f:
+            fadvise(f, getattr(os, 'POSIX_FADV_DONTNEED', 0))
+
+    def extract_chunk(self, members):
+        """Write (ZipInfo, target path) pairs using this worker's own ZipFile handle"""
+        # Workers seek to scattered members, so no sequential read hints here
+        with zipfile.ZipFile(self.backup_path, 'r') as zipf:
+            for info, target in members:
+                with zipf.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, CHUNK_SIZE)
+                with self._progress_lock:
+                    self._extracted += 1
+                    if self._extracted % PROGRESS_INTERVAL == 0:
+                        self.progress.emit(self._extracted, self._total)
+
 
 class CompareThread(QThread):
-    compare_completed = pyqtSignal(dict, str, str)
+    # Differences are passed as a plain object reference rather than
+    # converted as a dict for the queued cross-thread call
+    compare_completed = pyqtSignal(object, str, str)
     compare_failed = pyqtSignal(str)
+    progress = pyqtSignal(int, int)
 
     def __init__(self, source_backup, compare_backup, target_dir):
         super().__init__()
         self.source_backup = source_backup
         self.compare_backup = compare_backup
         self.target_dir = target_dir
+        # Reused read buffers for comparing extracted files
+        self._buffers = (bytearray(CHUNK_SIZE), bytearray(CHUNK_SIZE))
 
     def run(self):
         try:
             source_path = os.path.join(self.target_dir, self.source_backup)
             compare_path = os.path.join(self.target_dir, self.compare_backup)
 
-            # Load hash files
-            source_hash_path = source_path.replace('.zip', '_hashes.json')
-            compare_hash_path = compare_path.replace('.zip', '_hashes.json')
+            # Load hash data
+            source_hashes = read_manifest(source_path)
+            compare_hashes = read_manifest(compare_path)
 
-            # Check if hash files exist
-            if not os.path.exists(source_hash_path) or not os.path.exists(compare_hash_path):
-                # Fall back to old method if hash files don't exist
+            # Hash files written before 'algo' was recorded are MD5
+            if (source_hashes is None or compare_hashes is None or
+                    source_hashes.get('algo', 'md5') != compare_hashes.get('algo', 'md5')):
+                # Fall back to old method if hashes are missing or not comparable
                 differences = self.compare_backups_legacy(
                     source_path, compare_path)
             else:
-                # Load hash data
-                with open(source_hash_path, 'r') as f:
-                    source_hashes = json.load(f)
-                with open(compare_hash_path, 'r') as f:
-                    compare_hashes = json.load(f)
-
                 # Compare using hashes
                 differences = self.get_hash_based_differences(
                     source_hashes, compare_hashes)
@@ -180,42 +756,26 @@ class CompareThread(QThread):
 
     def compare_backups_legacy(self, source_path, compare_path):
         """Legacy comparison method (original implementation)"""
+        # Extract both backups to temporary directories, which are usually
+        # on a faster (often RAM-backed) filesystem than the backups
+        temp_source = tempfile.mkdtemp(prefix='lvcs_cmp_src_')
+        temp_compare = tempfile.mkdtemp(prefix='lvcs_cmp_dst_')
         try:
-            # Extract both backups to temporary directories
-            temp_source = os.path.join(self.target_dir, "temp_compare_source")
-            temp_compare = os.path.join(self.target_dir, "temp_compare_target")
-
-            # Clean up any existing temp directories
-            for temp_dir in [temp_source, temp_compare]:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-                os.makedirs(temp_dir)
-
-            # Extract source backup
-            with zipfile.ZipFile(source_path, 'r') as zipf:
-                zipf.extractall(temp_source)
-
-            # Extract compare backup
-            with zipfile.ZipFile(compare_path, 'r') as zipf:
-                zipf.extractall(temp_compare)
+            # Extract both backups, leaving out the hash manifests
+            for zip_path, temp_dir in [(source_path, temp_source),
+                                       (compare_path, temp_compare)]:
+                with zipfile.ZipFile(zip_path, 'r') as zipf:
+                    members = [name for name in zipf.namelist()
+                               if name != MANIFEST_NAME]
+                    zipf.extractall(temp_dir, members)
 
             # Compare the directories
-            differences = self.get_directory_differences(
-                temp_source, temp_compare)
+            return self.get_directory_differences(temp_source, temp_compare)
 
+        finally:
             # Clean up temporary directories
-            shutil.rmtree(temp_source)
-            shutil.rmtree(temp_compare)
-
-            return differences
-
-        except Exception as e:
-            # Clean up on error
-            for temp_dir in [os.path.join(self.target_dir, "temp_compare_source"),
-                             os.path.join(self.target_dir, "temp_compare_target")]:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-            raise e
+            shutil.rmtree(temp_source, ignore_errors=True)
+            shutil.rmtree(temp_compare, ignore_errors=True)
 
     def get_hash_based_differences(self, source_hashes, compare_hashes):
         """Get differences between two backups using hash comparison"""
@@ -226,23 +786,19 @@ class CompareThread(QThread):
             'unchanged': []
         }
 
-        source_files = set(source_hashes['file_hashes'].keys())
-        compare_files = set(compare_hashes['file_hashes'].keys())
+        source_files = source_hashes['file_hashes']
+        compare_files = compare_hashes['file_hashes']
 
         # Find added and removed files
-        differences['added'] = list(compare_files - source_files)
-        differences['removed'] = list(source_files - compare_files)
+        differences['added'] = list(compare_files.keys() - source_files.keys())
+        differences['removed'] = list(source_files.keys() - compare_files.keys())
 
-        # Check for modified files using hash comparison
-        common_files = source_files & compare_files
-        for file in common_files:
-            source_hash = source_hashes['file_hashes'][file]
-            compare_hash = compare_hashes['file_hashes'][file]
-
-            if source_hash != compare_hash:
-                differences['modified'].append(file)
-            else:
-                differences['unchanged'].append(file)
+        # Files whose (path, hash) pair appears in both backups are unchanged;
+        # the remaining common files were modified
+        unchanged = {file for file, _ in source_files.items() & compare_files.items()}
+        common_files = source_files.keys() & compare_files.keys()
+        differences['modified'] = list(common_files - unchanged)
+        differences['unchanged'] = list(unchanged)
 
         return differences
 
@@ -256,18 +812,8 @@ class CompareThread(QThread):
         }
 
         # Get all files from both directories
-        files1 = set()
-        files2 = set()
-
-        for root, dirs, files in os.walk(dir1):
-            for file in files:
-                rel_path = os.path.relpath(os.path.join(root, file), dir1)
-                files1.add(rel_path)
-
-        for root, dirs, files in os.walk(dir2):
-            for file in files:
-                rel_path = os.path.relpath(os.path.join(root, file), dir2)
-                files2.add(rel_path)
+        files1 = {rel_path for _, rel_path in iter_files(dir1)}
+        files2 = {rel_path for _, rel_path in iter_files(dir2)}
 
         # Find added and removed files
         differences['added'] = list(files2 - files1)
@@ -275,7 +821,9 @@ class CompareThread(QThread):
 
         # Check for modified files
         common_files = files1 & files2
-        for file in common_files:
+        for done, file in enumerate(common_files):
+            if done % PROGRESS_INTERVAL == 0:
+                self.progress.emit(done, len(common_files))
             file1_path = os.path.join(dir1, file)
             file2_path = os.path.join(dir2, file)
 
@@ -290,23 +838,393 @@ class CompareThread(QThread):
         """Check if two files are different"""
         try:
             # Compare file sizes first
-            if os.path.getsize(file1_path) != os.path.getsize(file2_path):
+            stat1 = os.stat(file1_path)
+            stat2 = os.stat(file2_path)
+            if stat1.st_size != stat2.st_size:
                 return True
 
-            # Compare file contents
             with open(file1_path, 'rb') as f1, open(file2_path, 'rb') as f2:
-                while True:
-                    chunk1 = f1.read(8192)
-                    chunk2 = f2.read(8192)
-                    if chunk1 != chunk2:
-                        return True
-                    if not chunk1:  # End of file
-                        break
-
-            return False
+                # Map both files and memcmp them a chunk at a time, stopping at
+                # the first difference (comparing whole memoryviews is per byte)
+                try:
+                    with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as m1, \
+                            mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as m2:
+                        return len(m1) != len(m2) or any(
+                            m1[i:i + CHUNK_SIZE] != m2[i:i + CHUNK_SIZE]
+                            for i in range(0, len(m1), CHUNK_SIZE))
+                except (ValueError, OSError):
+                    # Empty files can't be mapped; compare chunk by chunk instead
+                    return self.streams_differ(f1, f2)
         except Exception:
             return True  # Assume different if there's an error
 
+    def streams_differ(self, f1, f2):
+        """Compare two open binary files chunk by chunk"""
+        buffer1, buffer2 = self._buffers
+        while True:
+            n1 = f1.readinto(buffer1)
+            n2 = f2.readinto(buffer2)
+            # Compare as bytes (memcmp); memoryview comparison goes byte by byte
+            if n1 != n2 or buffer1[:n1] != buffer2[:n2]:
+                return True
+            if not n1:
+                return False
+
+
+class ZipPool:
+    """Keeps recently used backup zips open so their central directories are parsed once"""
+
+    def __init__(self, cap=ZIP_POOL_SIZE):
+        self.cap = cap
+        # path -> [ZipFile, mtime_ns, size, member names or None],
+        # least recently used first
+        self._zips = collections.OrderedDict()
+
+    def get(self, path):
+        """Return an open ZipFile for path, reopening it if the file changed"""
+        st = os.stat(path)
+        entry = self._zips.pop(path, None)
+        if entry is not None and (entry[1], entry[2]) != (st.st_mtime_ns, st.st_size):
+            entry[0].close()
+            entry = None
+        if entry is None:
+            entry = [zipfile.ZipFile(path, 'r'), st.st_mtime_ns, st.st_size, None]
+        self._zips[path] = entry
+
+        # Close the least recently used zips beyond the cap
+        while len(self._zips) > self.cap:
+            _, (victim, _, _, _) = self._zips.popitem(last=False)
+            victim.close()
+        return entry[0]
+
+    def names(self, zipf):
+        """Return a pooled zip's member names as a frozenset, built once per open"""
+        entry = self._zips.get(zipf.filename)
+        if entry is None or entry[0] is not zipf:
+            return frozenset(zipf.namelist())
+        if entry[3] is None:
+            entry[3] = frozenset(zipf.namelist())
+        return entry[3]
+
+    def discard(self, path):
+        """Close and forget the zip for path, e.g. before it is deleted"""
+        entry = self._zips.pop(path, None)
+        if entry is not None:
+            entry[0].close()
+
+    def close(self):
+        """Close every pooled zip"""
+        while self._zips:
+            _, (zipf, _, _, _) = self._zips.popitem()
+            zipf.close()
+
+    def __del__(self):
+        self.close()
+
+
+class MetadataSignals(QObject):
+    # (generation, list of metadata dicts, whether the fetch is finished)
+    metadata_ready = pyqtSignal(int, object, bool)
+
+
+class MetadataFetcher(QRunnable):
+    """Stats backups and reads their sidecar files off the UI thread"""
+
+    def __init__(self, generation, target_dir, backup_paths, listed_names,
+                 notes_cache, srcdir_cache):
+        super().__init__()
+        self.signals = MetadataSignals()
+        self.generation = generation
+        self.target_dir = target_dir
+        self.backup_paths = backup_paths
+        # Snapshots of the app's directory listing and sidecar caches
+        self.listed_names = frozenset(listed_names)
+        self.notes_cache = dict(notes_cache)
+        self.srcdir_cache = dict(srcdir_cache)
+
+    def file_exists(self, path):
+        """Check for a file next to the backups using the directory listing"""
+        name = os.path.basename(path)
+        if os.path.join(self.target_dir, name) == path:
+            return name in self.listed_names
+        return os.path.exists(path)
+
+    def run(self):
+        items = []
+        try:
+            for backup_path in self.backup_paths:
+                try:
+                    st = os.stat(backup_path)
+                except OSError:
+                    continue
+                item = {
+                    'path': backup_path,
+                    'size': st.st_size,
+                    'mtime': st.st_mtime,
+                    'size_str': format_size(st.st_size),
+                    'date_str': datetime.datetime.fromtimestamp(
+                        st.st_mtime).strftime("%Y-%m-%d %H:%M"),
+                }
+
+                # Sidecars already read by the app are taken from its caches
+                if backup_path in self.srcdir_cache:
+                    item['source_dir'] = self.srcdir_cache[backup_path]
+                else:
+                    try:
+                        item['source_dir'] = read_backup_source(
+                            backup_path, self.file_exists)
+                    except Exception:
+                        pass
+                if 'source_dir' in item:
+                    item['display_src'] = ellipsize_path(item['source_dir'], 50)
+                if backup_path in self.notes_cache:
+                    item['notes'] = self.notes_cache[backup_path]
+                else:
+                    try:
+                        item['notes'] = read_backup_notes(
+                            backup_path, self.file_exists)
+                    except Exception:
+                        pass
+                if 'notes' in item:
+                    item['display_notes'] = truncate_text(item['notes'], 30)
+                items.append(item)
+
+                # Hand rows over in batches so the list fills in as it goes
+                if len(items) >= PROGRESS_INTERVAL // 4:
+                    self.signals.metadata_ready.emit(self.generation, items, False)
+                    items = []
+        finally:
+            self.signals.metadata_ready.emit(self.generation, items, True)
+
+
+class BackupListModel(QAbstractListModel):
+    """List model holding one dict per backup shown in the backups tab"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._backups = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._backups)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._backups[index.row()]['name']
+        return None
+
+    def backup_at(self, row):
+        """Return the backup dict for a row"""
+        return self._backups[row]
+
+    def set_backups(self, backups):
+        """Replace every row with the given backup dicts"""
+        self.beginResetModel()
+        self._backups = backups
+        self.endResetModel()
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or count < 1 or row + count > len(self._backups):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._backups[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def row_for_path(self, path):
+        """Return the row of a backup, or -1 if it isn't listed"""
+        for row, backup in enumerate(self._backups):
+            if backup['path'] == path:
+                return row
+        return -1
+
+    def update_backup(self, path, **fields):
+        """Update fields of a listed backup and repaint its row"""
+        row = self.row_for_path(path)
+        if row < 0:
+            return
+        self._backups[row].update(fields)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def update_metadata(self, items):
+        """Merge fetched metadata into the listed backups, repainting only their rows"""
+        rows = {backup['path']: row for row, backup in enumerate(self._backups)}
+        changed = []
+        for item in items:
+            row = rows.get(item['path'])
+            if row is not None:
+                self._backups[row].update(item)
+                changed.append(row)
+        if changed:
+            self.dataChanged.emit(self.index(min(changed)), self.index(max(changed)))
+
+    def sort_by_mtime(self):
+        """Order backups newest first; returns whether the order changed"""
+        ordered = sorted(self._backups, key=lambda b: b['mtime'], reverse=True)
+        if ordered == self._backups:
+            return False
+        self.layoutAboutToBeChanged.emit()
+        self._backups = ordered
+        self.layoutChanged.emit()
+        return True
+
+    def backup_names(self):
+        """Return the names of the listed backups in display order"""
+        return [backup['name'] for backup in self._backups]
+
+
+class BackupCardDelegate(QStyledItemDelegate):
+    """Paints each backup as a card and turns clicks on it into signals"""
+    restore_requested = pyqtSignal(str)
+    delete_requested = pyqtSignal(str)
+    edit_notes_requested = pyqtSignal(str)
+    open_path_requested = pyqtSignal(str)
+
+    CARD_HEIGHT = 218
+    MARGIN = 5
+    PADDING = 15
+    # (part, height, gap below) for each row of a card, top to bottom
+    ROWS = (('name', 24, 10), ('source', 16, 6), ('location', 16, 10),
+            ('info', 16, 10), ('notes', 28, 10), ('buttons', 32, 0))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name_font = QFont("Segoe UI", 14, QFont.Bold)
+        self.text_font = QFont("Segoe UI")
+        self.text_font.setPixelSize(11)
+        self.label_font = QFont(self.text_font)
+        self.label_font.setBold(True)
+        self.notes_font = QFont(self.text_font)
+        self.notes_font.setItalic(True)
+        self.button_font = QFont("Segoe UI")
+        self.button_font.setPixelSize(10)
+        self.button_font.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QSize(400, self.CARD_HEIGHT)
+
+    def card_rects(self, rect):
+        """Lay out the parts of a card drawn in an item rect"""
+        card = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        inner = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        rects = {'card': card}
+        y = inner.top()
+        for part, height, gap in self.ROWS:
+            rects[part] = QRect(inner.left(), y, inner.width(), height)
+            y += height + gap
+
+        # Edit button at the end of the notes row, Restore/Delete sharing the last row
+        notes = rects['notes']
+        rects['edit'] = QRect(notes.right() - 79, notes.top(), 80, notes.height())
+        buttons = rects.pop('buttons')
+        half = (buttons.width() - 10) // 2
+        rects['restore'] = QRect(buttons.left(), buttons.top(), half, buttons.height())
+        rects['delete'] = QRect(buttons.left() + half + 10, buttons.top(),
+                                buttons.width() - half - 10, buttons.height())
+        return rects
+
+    def hit_test(self, rect, backup, pos):
+        """Return the clickable part of a card under pos, if any"""
+        rects = self.card_rects(rect)
+        for part in ('edit', 'restore', 'delete', 'location', 'source'):
+            if rects[part].contains(pos):
+                if part == 'source' and not backup['source_dir']:
+                    return None
+                return part
+        return None
+
+    def paint(self, painter, option, index):
+        backup = index.model().backup_at(index.row())
+        rects = self.card_rects(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background
+        painter.setPen(QColor("#dee2e6"))
+        painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(rects['card'], 8, 8)
+
+        # Card header with backup name
+        self.draw_text(painter, rects['name'], self.name_font, "#2c3e50", backup['name'])
+
+        # Source directory and backup location, truncated when the row was built
+        if backup['source_dir']:
+            self.draw_text(painter, rects['source'], self.text_font, "#3498db",
+                           f"📁 Source: {backup['display_src']}")
+        self.draw_text(painter, rects['location'], self.text_font, "#27ae60",
+                       f"💾 Location: {backup['display_loc']}")
+
+        # Size and modification date side by side
+        info = rects['info']
+        half = info.width() // 2
+        self.draw_text(painter, QRect(info.left(), info.top(), half, info.height()),
+                       self.text_font, "#7f8c8d", f"📊 Size: {backup['size_str']}")
+        self.draw_text(painter, QRect(info.left() + half, info.top(), info.width() - half,
+                                      info.height()),
+                       self.text_font, "#7f8c8d", f"🕒 Created: {backup['date_str']}")
+
+        # Notes, truncated when the row was built
+        notes = rects['notes']
+        label = "📝 Notes:"
+        label_width = QFontMetrics(self.label_font).horizontalAdvance(label) + 10
+        self.draw_text(painter, notes, self.label_font, "#7f8c8d", label)
+        notes_rect = QRect(notes.left() + label_width, notes.top(),
+                           rects['edit'].left() - notes.left() - label_width - 10,
+                           notes.height())
+        if backup['notes']:
+            self.draw_text(painter, notes_rect, self.notes_font, "#2c3e50",
+                           backup['display_notes'])
+        else:
+            self.draw_text(painter, notes_rect, self.notes_font, "#bdc3c7", "No notes")
+
+        # Buttons
+        self.draw_button(painter, rects['edit'], "#95a5a6", "✏️ Edit")
+        self.draw_button(painter, rects['restore'], "#3498db", "🔄 Restore")
+        self.draw_button(painter, rects['delete'], "#e74c3c", "🗑️ Delete")
+        painter.restore()
+
+    def draw_text(self, painter, rect, font, color, text, flags=Qt.AlignLeft | Qt.AlignVCenter):
+        """Draw one line of card text"""
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(rect, flags, text)
+
+    def draw_button(self, painter, rect, color, text):
+        """Draw a rounded card button"""
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(rect, 6, 6)
+        self.draw_text(painter, rect, self.button_font, "black", text, Qt.AlignCenter)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseMove, QEvent.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        backup = model.backup_at(index.row())
+        part = self.hit_test(option.rect, backup, event.pos())
+
+        # Show a pointing hand over links and buttons
+        if event.type() == QEvent.MouseMove:
+            viewport = self.parent().viewport()
+            if part is None:
+                viewport.unsetCursor()
+            else:
+                viewport.setCursor(Qt.PointingHandCursor)
+            return False
+
+        if event.button() != Qt.LeftButton or part is None:
+            return False
+        if part == 'source':
+            self.open_path_requested.emit(backup['source_dir'])
+        elif part == 'location':
+            self.open_path_requested.emit(os.path.dirname(backup['path']))
+        elif part == 'edit':
+            self.edit_notes_requested.emit(backup['path'])
+        elif part == 'restore':
+            self.restore_requested.emit(backup['path'])
+        elif part == 'delete':
+            self.delete_requested.emit(backup['path'])
+        return True
+
 
 class BackupRestoreApp(QMainWindow):
     def __init__(self):
@@ -319,6 +1237,31 @@ class BackupRestoreApp(QMainWindow):
         self.source_dir = ""
         self.target_dir = ""
 
+        # Directory and file names seen by the last target directory scan
+        self._listed_dir = None
+        self._listed_names = set()
+        # Backup zips kept open for diffing, with their member names
+        self._zip_pool = ZipPool()
+        # Notes and source directories read for each backup; an empty string
+        # means the sidecar was checked and is absent. Kept across refreshes
+        # and only dropped by save_backup_notes, delete_backup or a rescan
+        self._notes_cache = {}
+        self._srcdir_cache = {}
+        # Incremented per load_backups so stale metadata fetches are ignored
+        self._metadata_generation = 0
+
+        # Opens a path in the system file browser, picked once for this platform.
+        # Popen returns without waiting for the browser to start
+        if os.name == 'nt':  # Windows
+            self._open_path = os.startfile
+        elif sys.platform == 'darwin':  # macOS
+            self._open_path = lambda path: subprocess.Popen(['open', path])
+        elif os.name == 'posix':  # Linux
+            self._open_path = lambda path: subprocess.Popen(['xdg-open', path])
+        else:
+            self._open_path = lambda path: QMessageBox.information(
+                self, "Info", f"Path: {path}")
+
         # Load configuration
         self.load_config()
 
@@ -333,90 +1276,17 @@ class BackupRestoreApp(QMainWindow):
 
     def setup_styles(self):
         """Setup modern styling for the application"""
-        # Set application style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f8f9fa;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-            }
-            QPushButton {
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 10px;
-            }
-            QPushButton[class="primary"] {
-                background-color: #3498db;
-                color: black;
-            }
-            QPushButton[class="primary"]:hover {
-                background-color: #2980b9;
-            }
-            QPushButton[class="secondary"] {
-                background-color: #95a5a6;
-                color: black;
-            }
-            QPushButton[class="secondary"]:hover {
-                background-color: #7f8c8d;
-            }
-            QPushButton[class="danger"] {
-                background-color: #e74c3c;
-                color: black;
-            }
-            QPushButton[class="danger"]:hover {
-                background-color: #c0392b;
-            }
-            QLineEdit {
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                padding: 8px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border-color: #3498db;
-            }
-            QComboBox {
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                padding: 8px;
-                background-color: white;
-            }
-            QComboBox:focus {
-                border-color: #3498db;
-            }
-            QProgressBar {
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                text-align: center;
-                background-color: #e9ecef;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                border-radius: 4px;
-            }
-        """)
+        # Set the application stylesheet once; widgets pick rules up by
+        # object name or class property
+        QApplication.instance().setStyleSheet(GLOBAL_QSS)
 
     def load_config(self):
         """Load configuration from file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self.source_dir = config.get('source_dir', '')
-                    self.target_dir = config.get('target_dir', '')
+                config = load_json(self.config_file)
+                self.source_dir = config.get('source_dir', '')
+                self.target_dir = config.get('target_dir', '')
         except Exception as e:
             print(f"Error loading config: {e}")
 
@@ -427,8 +1297,7 @@ class BackupRestoreApp(QMainWindow):
                 'source_dir': self.source_dir,
                 'target_dir': self.target_dir
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f)
+            save_json(self.config_file, config)
         except Exception as e:
             print(f"Error saving config: {e}")
 
@@ -452,62 +1321,46 @@ class BackupRestoreApp(QMainWindow):
         title_label = QLabel("LocalVCS - Backup & Restore Manager")
         title_font = QFont("Segoe UI", 20, QFont.Bold)
         title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #2c3e50; margin-bottom: 20px;")
+        title_label.setProperty("class", "heading")
         left_layout.addWidget(title_label)
 
         # Tab widget for backup list and comparison results
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                background-color: #f8f9fa;
-            }
-            QTabBar::tab {
-                background-color: #bdc3c7;
-                color: #2c3e50;
-                padding: 8px 24px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                font-weight: bold;
-                min-width: 120px;
-            }
-            QTabBar::tab:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QTabBar::tab:hover {
-                background-color: #95a5a6;
-            }
-        """)
+        self.tab_widget.setObjectName("mainTabs")
 
         # Backup list tab
         backup_tab = QWidget()
         backup_layout = QVBoxLayout(backup_tab)
         backup_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Backups scroll area
-        self.backups_scroll = QScrollArea()
-        self.backups_scroll.setWidgetResizable(True)
-        self.backups_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.backups_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.backups_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #f8f9fa;
-            }
-        """)
-
-        # Backups container
-        self.backups_container = QWidget()
-        self.backups_layout = QVBoxLayout(self.backups_container)
-        self.backups_layout.setAlignment(Qt.AlignTop)
-        self.backups_layout.setSpacing(10)
-        self.backups_layout.setContentsMargins(10, 10, 10, 10)
-
-        self.backups_scroll.setWidget(self.backups_container)
-        backup_layout.addWidget(self.backups_scroll)
+        # Backups list, painting each backup as a card so no per-backup widgets exist
+        self.backup_model = BackupListModel(self)
+        self.backups_view = QListView()
+        self.backups_view.setModel(self.backup_model)
+        self.backup_delegate = BackupCardDelegate(self.backups_view)
+        self.backups_view.setItemDelegate(self.backup_delegate)
+        self.backups_view.setSelectionMode(QListView.NoSelection)
+        self.backups_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.backups_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.backups_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.backups_view.setMouseTracking(True)
+        # Cards share one size hint, so the view lays out and paints only the
+        # rows scrolled into view; long lists are laid out in batches
+        self.backups_view.setUniformItemSizes(True)
+        self.backups_view.setLayoutMode(QListView.Batched)
+        self.backups_view.setBatchSize(50)
+        self.backups_view.setObjectName("backupsList")
+
+        # Card clicks are queued so the list can be reset from the handlers
+        self.backup_delegate.restore_requested.connect(
+            self.start_restore, Qt.QueuedConnection)
+        self.backup_delegate.delete_requested.connect(
+            self.delete_backup, Qt.QueuedConnection)
+        self.backup_delegate.edit_notes_requested.connect(
+            self.edit_backup_notes, Qt.QueuedConnection)
+        self.backup_delegate.open_path_requested.connect(
+            self.open_in_explorer, Qt.QueuedConnection)
+        backup_layout.addWidget(self.backups_view)
 
         # Add backup tab to tab widget
         self.tab_widget.addTab(backup_tab, "📦 Backups")
@@ -521,8 +1374,7 @@ class BackupRestoreApp(QMainWindow):
         self.comparison_title = QLabel("🔍 Comparison Results")
         comparison_font = QFont("Segoe UI", 18, QFont.Bold)
         self.comparison_title.setFont(comparison_font)
-        self.comparison_title.setStyleSheet(
-            "color: #2c3e50; margin-bottom: 20px;")
+        self.comparison_title.setProperty("class", "heading")
         self.comparison_layout.addWidget(self.comparison_title)
 
         # Comparison results content
@@ -532,8 +1384,7 @@ class BackupRestoreApp(QMainWindow):
         # Add placeholder text
         placeholder_label = QLabel(
             "Select backups to compare and click 'Compare Backups' to see results here.")
-        placeholder_label.setStyleSheet(
-            "color: #7f8c8d; font-size: 16px; text-align: center; padding: 40px;")
+        placeholder_label.setObjectName("comparisonPlaceholder")
         placeholder_label.setAlignment(Qt.AlignCenter)
         self.comparison_content_layout.addWidget(placeholder_label)
 
@@ -555,7 +1406,7 @@ class BackupRestoreApp(QMainWindow):
         controls_title = QLabel("Controls")
         controls_font = QFont("Segoe UI", 18, QFont.Bold)
         controls_title.setFont(controls_font)
-        controls_title.setStyleSheet("color: #2c3e50; margin-bottom: 20px;")
+        controls_title.setProperty("class", "heading")
         right_layout.addWidget(controls_title)
 
         # Source directory section
@@ -563,7 +1414,7 @@ class BackupRestoreApp(QMainWindow):
         source_layout = QVBoxLayout(source_group)
 
         source_label = QLabel("Directory to backup:")
-        source_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        source_label.setProperty("class", "hint")
         source_layout.addWidget(source_label)
 
         self.source_edit = QLineEdit()
@@ -583,7 +1434,7 @@ class BackupRestoreApp(QMainWindow):
         target_layout = QVBoxLayout(target_group)
 
         target_label = QLabel("Where to store backups:")
-        target_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        target_label.setProperty("class", "hint")
         target_layout.addWidget(target_label)
 
         self.target_edit = QLineEdit()
@@ -596,6 +1447,11 @@ class BackupRestoreApp(QMainWindow):
         browse_target_btn.clicked.connect(self.browse_target)
         target_layout.addWidget(browse_target_btn)
 
+        rescan_btn = QPushButton("Rescan Backups")
+        rescan_btn.setProperty("class", "secondary")
+        rescan_btn.clicked.connect(self.rescan_backups)
+        target_layout.addWidget(rescan_btn)
+
         right_layout.addWidget(target_group)
 
         # Backup button
@@ -609,14 +1465,14 @@ class BackupRestoreApp(QMainWindow):
         compare_layout = QVBoxLayout(compare_group)
 
         source_backup_label = QLabel("Source backup:")
-        source_backup_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        source_backup_label.setProperty("class", "hint")
         compare_layout.addWidget(source_backup_label)
 
         self.source_backup_combo = QComboBox()
         compare_layout.addWidget(self.source_backup_combo)
 
         compare_against_label = QLabel("Compare against:")
-        compare_against_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        compare_against_label.setProperty("class", "hint")
         compare_layout.addWidget(compare_against_label)
 
         self.compare_backup_combo = QComboBox()
@@ -634,7 +1490,7 @@ class BackupRestoreApp(QMainWindow):
         progress_layout = QVBoxLayout(progress_group)
 
         self.progress_label = QLabel("Ready")
-        self.progress_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        self.progress_label.setProperty("class", "hint")
         progress_layout.addWidget(self.progress_label)
 
         self.progress_bar = QProgressBar()
@@ -709,51 +1565,18 @@ class BackupRestoreApp(QMainWindow):
 
         # Start backup in separate thread
         self.backup_thread = BackupThread(self.source_dir, self.target_dir)
-        self.backup_thread.backup_completed.connect(self.backup_completed)
-        self.backup_thread.backup_failed.connect(self.backup_failed)
+        self.backup_thread.backup_completed.connect(
+            self.backup_completed, Qt.QueuedConnection)
+        self.backup_thread.backup_failed.connect(
+            self.backup_failed, Qt.QueuedConnection)
+        self.backup_thread.progress.connect(
+            self.update_progress, Qt.QueuedConnection)
         self.backup_thread.start()
 
-    def create_backup(self):
-        """Create a backup of the source directory"""
-        try:
-            # Create timestamp for backup name
-            timestamp = datetime.datetime.now().strftime("%m_%d_%Y_%H_%M_%S")
-            backup_name = f"BACKUP_{timestamp}"
-            backup_path = os.path.join(self.target_dir, backup_name + ".zip")
-
-            # Calculate file hashes before creating zip
-            file_hashes = {}
-            for root, dirs, files in os.walk(self.source_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, self.source_dir)
-                    file_hashes[rel_path] = self.calculate_file_hash(file_path)
-
-            # Create zip file
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(self.source_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, self.source_dir)
-                        zipf.write(file_path, arcname)
-
-            # Save hash information
-            hash_file_path = backup_path.replace('.zip', '_hashes.json')
-            hash_data = {
-                'backup_name': backup_name,
-                'created_at': datetime.datetime.now().isoformat(),
-                'file_hashes': file_hashes,
-                'total_files': len(file_hashes),
-                'source_directory': self.source_dir
-            }
-            with open(hash_file_path, 'w') as f:
-                json.dump(hash_data, f, indent=2)
-
-            # Update GUI in main thread
-            self.root.after(0, self.backup_completed, backup_path)
-
-        except Exception as e:
-            self.root.after(0, self.backup_failed, str(e))
+    def update_progress(self, done, total):
+        """Called when a worker thread reports progress"""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
 
     def backup_completed(self, backup_path):
         """Called when backup is completed"""
@@ -773,194 +1596,129 @@ class BackupRestoreApp(QMainWindow):
 
     def load_backups(self):
         """Load and display existing backups"""
-        # Clear existing backup cards
-        for i in reversed(range(self.backups_layout.count())):
-            self.backups_layout.itemAt(i).widget().setParent(None)
+        self._listed_dir = None
+        self._listed_names.clear()
 
         if not self.target_dir or not os.path.exists(self.target_dir):
+            self._metadata_generation += 1
+            self.backup_model.set_backups([])
             return
 
-        # Find all backup files
+        # Find all backup files, remembering every name for sidecar lookups.
+        # Names carry the creation timestamp, which gives a first newest-first
+        # order until the metadata fetch has the modification times
         backup_files = []
-        for file in os.listdir(self.target_dir):
-            if file.startswith("BACKUP_") and file.endswith(".zip"):
-                file_path = os.path.join(self.target_dir, file)
-                backup_files.append((file, file_path))
-
-        # Sort by modification time (newest first)
-        backup_files.sort(key=lambda x: os.path.getmtime(x[1]), reverse=True)
-
-        # Update comparison dropdowns
-        backup_names = [file for file, _ in backup_files]
-        self.source_backup_combo.clear()
-        self.source_backup_combo.addItems(backup_names)
-        self.compare_backup_combo.clear()
-        self.compare_backup_combo.addItems(backup_names)
-
-        # Create backup cards
-        for i, (backup_name, backup_path) in enumerate(backup_files):
-            self.create_backup_card(backup_name, backup_path, i)
-
-    def create_backup_card(self, backup_name, backup_path, index):
-        """Create a modern card widget for a backup"""
-        # Create card frame
-        card_frame = QFrame()
-        card_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                margin: 5px;
-            }
-        """)
-
-        # Create main layout for card
-        card_layout = QVBoxLayout(card_frame)
-        card_layout.setContentsMargins(15, 15, 15, 15)
-        card_layout.setSpacing(10)
+        with os.scandir(self.target_dir) as it:
+            for entry in it:
+                self._listed_names.add(entry.name)
+                if entry.name.startswith("BACKUP_") and entry.name.endswith(".zip"):
+                    backup_files.append((entry.name, entry.path))
+        self._listed_dir = self.target_dir
+        backup_files.sort(key=lambda x: (backup_timestamp(x[0]), x[0]), reverse=True)
+
+        # Show every backup straight away; size, date, source and notes
+        # are filled in by a MetadataFetcher on the thread pool
+        display_loc = ellipsize_path(self.target_dir, 50)
+        backups = []
+        for backup_name, backup_path in backup_files:
+            source_dir = self._srcdir_cache.get(backup_path, '')
+            notes = self._notes_cache.get(backup_path, '')
+            backups.append({
+                'path': backup_path,
+                'name': backup_name,
+                'size': 0,
+                'mtime': 0,
+                'size_str': '...',
+                'date_str': '...',
+                'source_dir': source_dir,
+                'notes': notes,
+                'display_src': ellipsize_path(source_dir, 50),
+                'display_loc': display_loc,
+                'display_notes': truncate_text(notes, 30),
+            })
+        self.backup_model.set_backups(backups)
+        self.set_backup_combos([backup_name for backup_name, _ in backup_files])
+
+        self._metadata_generation += 1
+        fetcher = MetadataFetcher(
+            self._metadata_generation, self.target_dir,
+            [backup_path for _, backup_path in backup_files],
+            self._listed_names, self._notes_cache, self._srcdir_cache)
+        fetcher.signals.metadata_ready.connect(
+            self.metadata_ready, Qt.QueuedConnection)
+        self._metadata_fetcher = fetcher
+        QThreadPool.globalInstance().start(fetcher)
+
+    def metadata_ready(self, generation, items, done):
+        """Called when the metadata fetcher delivers a batch of backups"""
+        if generation != self._metadata_generation:
+            return
 
-        # Card header with backup name
-        name_label = QLabel(backup_name)
-        name_font = QFont("Segoe UI", 14, QFont.Bold)
-        name_label.setFont(name_font)
-        name_label.setStyleSheet("color: #2c3e50;")
-        card_layout.addWidget(name_label)
-
-        # Source directory
-        source_dir = self.get_backup_source_directory(backup_path)
-        if source_dir:
-            # Truncate long paths for display
-            display_path = source_dir
-            if len(display_path) > 50:
-                display_path = "..." + display_path[-47:]
-            source_label = QLabel(f"📁 Source: {display_path}")
-            source_label.setStyleSheet("color: #3498db; font-size: 11px;")
-            source_label.setCursor(Qt.PointingHandCursor)
-            source_label.mousePressEvent = lambda e, path=source_dir: self.open_in_explorer(
-                path)
-            card_layout.addWidget(source_label)
-
-        # Backup location
-        backup_dir = os.path.dirname(backup_path)
-        backup_display = backup_dir
-        if len(backup_display) > 50:
-            backup_display = "..." + backup_display[-47:]
-        backup_location_label = QLabel(f"💾 Location: {backup_display}")
-        backup_location_label.setStyleSheet("color: #27ae60; font-size: 11px;")
-        backup_location_label.setCursor(Qt.PointingHandCursor)
-        backup_location_label.mousePressEvent = lambda e, path=backup_dir: self.open_in_explorer(
-            path)
-        card_layout.addWidget(backup_location_label)
-
-        # Info section
-        info_layout = QHBoxLayout()
-
-        # Backup size
-        size = os.path.getsize(backup_path)
-        size_str = self.format_size(size)
-        size_label = QLabel(f"📊 Size: {size_str}")
-        size_label.setStyleSheet("color: #7f8c8d; font-size: 11px;")
-        info_layout.addWidget(size_label)
-
-        # Modification date
-        mod_time = datetime.datetime.fromtimestamp(
-            os.path.getmtime(backup_path))
-        date_str = mod_time.strftime("%Y-%m-%d %H:%M")
-        date_label = QLabel(f"🕒 Created: {date_str}")
-        date_label.setStyleSheet("color: #7f8c8d; font-size: 11px;")
-        info_layout.addWidget(date_label)
-
-        card_layout.addLayout(info_layout)
-
-        # Notes section
-        notes_layout = QHBoxLayout()
-
-        # Notes label
-        notes_label = QLabel("📝 Notes:")
-        notes_label.setStyleSheet(
-            "color: #7f8c8d; font-size: 11px; font-weight: bold;")
-        notes_layout.addWidget(notes_label)
-
-        # Notes display/edit area
-        notes_text = self.get_backup_notes(backup_path)
-        if notes_text:
-            # Truncate notes if longer than 30 characters
-            display_text = notes_text
-            if len(notes_text) > 30:
-                display_text = notes_text[:30] + "..."
-            notes_display = QLabel(display_text)
-            notes_display.setStyleSheet(
-                "color: #2c3e50; font-size: 11px; font-style: italic;")
-            notes_layout.addWidget(notes_display)
-        else:
-            notes_display = QLabel("No notes")
-            notes_display.setStyleSheet(
-                "color: #bdc3c7; font-size: 11px; font-style: italic;")
-            notes_layout.addWidget(notes_display)
-
-        # Edit notes button
-        edit_notes_btn = QPushButton("✏️ Edit")
-        edit_notes_btn.setProperty("class", "secondary")
-        edit_notes_btn.setMinimumWidth(80)
-        edit_notes_btn.clicked.connect(
-            lambda: self.edit_backup_notes(backup_path, notes_display))
-        notes_layout.addWidget(edit_notes_btn)
-
-        card_layout.addLayout(notes_layout)
-
-        # Action buttons
-        button_layout = QHBoxLayout()
+        # Keep sidecar results; values saved since the fetch started win
+        for item in items:
+            if 'source_dir' in item:
+                source_dir = self._srcdir_cache.setdefault(
+                    item['path'], item['source_dir'])
+                if source_dir != item['source_dir']:
+                    item['source_dir'] = source_dir
+                    item['display_src'] = ellipsize_path(source_dir, 50)
+            if 'notes' in item:
+                notes = self._notes_cache.setdefault(item['path'], item['notes'])
+                if notes != item['notes']:
+                    item['notes'] = notes
+                    item['display_notes'] = truncate_text(notes, 30)
+        self.backup_model.update_metadata(items)
+
+        # Sort by modification time (newest first) once every backup is known
+        if done:
+            self._metadata_fetcher = None
+            if self.backup_model.sort_by_mtime():
+                self.set_backup_combos(self.backup_model.backup_names())
+
+    def set_backup_combos(self, backup_names):
+        """Fill the comparison dropdowns, keeping their current selections"""
+        for combo in (self.source_backup_combo, self.compare_backup_combo):
+            current = combo.currentText()
+            combo.clear()
+            combo.addItems(backup_names)
+            if current in backup_names:
+                combo.setCurrentText(current)
+
+    def rescan_backups(self):
+        """Reload backups, re-reading notes and source directories from disk"""
+        self._notes_cache.clear()
+        self._srcdir_cache.clear()
+        self.load_backups()
 
-        # Restore button
-        restore_btn = QPushButton("🔄 Restore")
-        restore_btn.setProperty("class", "primary")
-        restore_btn.clicked.connect(lambda: self.start_restore(backup_path))
-        button_layout.addWidget(restore_btn)
-
-        # Delete button
-        delete_btn = QPushButton("🗑️ Delete")
-        delete_btn.setProperty("class", "danger")
-        delete_btn.clicked.connect(lambda: self.delete_backup(backup_path))
-        button_layout.addWidget(delete_btn)
-
-        card_layout.addLayout(button_layout)
-
-        # Add card to backups layout
-        self.backups_layout.addWidget(card_frame)
-
-    def format_size(self, size_bytes):
-        """Format file size in human readable format"""
-        if size_bytes == 0:
-            return "0B"
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        return f"{size_bytes:.1f}{size_names[i]}"
+    def _file_exists(self, path):
+        """Check for a file next to the backups using the last directory scan"""
+        if self._listed_dir is not None:
+            name = os.path.basename(path)
+            if os.path.join(self._listed_dir, name) == path:
+                return name in self._listed_names
+        return os.path.exists(path)
 
     def get_backup_source_directory(self, backup_path):
         """Get the source directory used for a backup"""
+        if backup_path in self._srcdir_cache:
+            return self._srcdir_cache[backup_path]
         try:
-            hash_file_path = backup_path.replace('.zip', '_hashes.json')
-            if os.path.exists(hash_file_path):
-                with open(hash_file_path, 'r') as f:
-                    hash_data = json.load(f)
-                    return hash_data.get('source_directory', '')
-            return ''
+            source_dir = read_backup_source(backup_path, self._file_exists)
         except Exception:
             return ''
+        self._srcdir_cache[backup_path] = source_dir
+        return source_dir
 
     def get_backup_notes(self, backup_path):
         """Get notes for a backup"""
+        if backup_path in self._notes_cache:
+            return self._notes_cache[backup_path]
         try:
-            notes_file_path = backup_path.replace('.zip', '_notes.txt')
-            if os.path.exists(notes_file_path):
-                with open(notes_file_path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            return ''
+            notes = read_backup_notes(backup_path, self._file_exists)
         except Exception:
             return ''
+        self._notes_cache[backup_path] = notes
+        return notes
 
     def save_backup_notes(self, backup_path, notes):
         """Save notes for a backup"""
@@ -968,10 +1726,12 @@ class BackupRestoreApp(QMainWindow):
             notes_file_path = backup_path.replace('.zip', '_notes.txt')
             with open(notes_file_path, 'w', encoding='utf-8') as f:
                 f.write(notes)
+            self._listed_names.add(os.path.basename(notes_file_path))
+            self._notes_cache[backup_path] = notes.strip()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save notes: {e}")
 
-    def edit_backup_notes(self, backup_path, notes_display):
+    def edit_backup_notes(self, backup_path):
         """Open dialog to edit backup notes"""
         current_notes = self.get_backup_notes(backup_path)
 
@@ -985,25 +1745,13 @@ class BackupRestoreApp(QMainWindow):
 
         # Title
         title_label = QLabel(f"Notes for: {os.path.basename(backup_path)}")
-        title_label.setStyleSheet(
-            "font-size: 14px; font-weight: bold; color: #2c3e50; margin-bottom: 10px;")
+        title_label.setObjectName("notesTitle")
         layout.addWidget(title_label)
 
         # Text area
         text_edit = QTextEdit()
         text_edit.setPlainText(current_notes)
-        text_edit.setStyleSheet("""
-            QTextEdit {
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QTextEdit:focus {
-                border-color: #3498db;
-            }
-        """)
+        text_edit.setObjectName("notesEdit")
         layout.addWidget(text_edit)
 
         # Buttons
@@ -1012,7 +1760,7 @@ class BackupRestoreApp(QMainWindow):
         save_btn = QPushButton("Save")
         save_btn.setProperty("class", "primary")
         save_btn.clicked.connect(lambda: self.save_notes_and_close(
-            dialog, backup_path, text_edit.toPlainText(), notes_display))
+            dialog, backup_path, text_edit.toPlainText()))
         button_layout.addWidget(save_btn)
 
         cancel_btn = QPushButton("Cancel")
@@ -1024,104 +1772,123 @@ class BackupRestoreApp(QMainWindow):
 
         dialog.exec_()
 
-    def save_notes_and_close(self, dialog, backup_path, notes, notes_display):
+    def save_notes_and_close(self, dialog, backup_path, notes):
         """Save notes and update the display"""
+        # Nothing to write if the notes are unchanged (a cache lookup)
+        if notes.strip() == self.get_backup_notes(backup_path):
+            dialog.accept()
+            return
+
         self.save_backup_notes(backup_path, notes)
 
-        # Update the display with truncation
-        if notes.strip():
-            # Truncate notes if longer than 30 characters
-            display_text = notes
-            if len(notes) > 30:
-                display_text = notes[:30] + "..."
-            notes_display.setText(display_text)
-            notes_display.setStyleSheet(
-                "color: #2c3e50; font-size: 11px; font-style: italic;")
-        else:
-            notes_display.setText("No notes")
-            notes_display.setStyleSheet(
-                "color: #bdc3c7; font-size: 11px; font-style: italic;")
+        # Repaint the backup's card with the new notes
+        notes = self.get_backup_notes(backup_path)
+        self.backup_model.update_backup(
+            backup_path, notes=notes, display_notes=truncate_text(notes, 30))
 
         dialog.accept()
 
-    def get_file_diff(self, source_backup, compare_backup, file_path):
-        """Get diff content for a specific file between two backups"""
+    @contextlib.contextmanager
+    def _open_zips(self, source_backup, compare_backup):
+        """Borrow both backups from the zip pool for diffing; yields None for a
+        backup that can't be opened. The zips stay open for later comparisons"""
+        zips = []
+        for backup in (source_backup, compare_backup):
+            try:
+                zips.append(self._zip_pool.get(
+                    os.path.join(self.target_dir, backup)))
+            except (OSError, zipfile.BadZipFile):
+                zips.append(None)
+        yield tuple(zips)
+
+    def _diff_one(self, zip1, zip2, file_path, source_backup, compare_backup):
+        """Get diff content for a specific file between two open backups"""
         try:
-            # Extract both backups to temporary directories
-            temp_source = os.path.join(self.target_dir, "temp_diff_source")
-            temp_compare = os.path.join(self.target_dir, "temp_diff_compare")
-
-            # Clean up any existing temp directories
-            for temp_dir in [temp_source, temp_compare]:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-                os.makedirs(temp_dir)
-
-            # Extract source backup
-            source_path = os.path.join(self.target_dir, source_backup)
-            with zipfile.ZipFile(source_path, 'r') as zipf:
-                zipf.extractall(temp_source)
-
-            # Extract compare backup
-            compare_path = os.path.join(self.target_dir, compare_backup)
-            with zipfile.ZipFile(compare_path, 'r') as zipf:
-                zipf.extractall(temp_compare)
-
-            # Get file paths
-            file1_path = os.path.join(temp_source, file_path)
-            file2_path = os.path.join(temp_compare, file_path)
-
-            # Check if both files exist
-            if not os.path.exists(file1_path) or not os.path.exists(file2_path):
+            if zip1 is None or zip2 is None:
+                return None
+
+            # Skip files missing from one of the backups
+            member = file_path.replace(os.sep, '/')
+            if (member not in self._zip_pool.names(zip1) or
+                    member not in self._zip_pool.names(zip2)):
                 return None
+            info1 = zip1.getinfo(member)
+            info2 = zip2.getinfo(member)
 
-            # Read file contents
-            with open(file1_path, 'r', encoding='utf-8', errors='ignore') as f1:
-                lines1 = f1.readlines()
-            with open(file2_path, 'r', encoding='utf-8', errors='ignore') as f2:
-                lines2 = f2.readlines()
+            # Matching CRC-32 and size from the zip headers: nothing to diff
+            if info1.CRC == info2.CRC and info1.file_size == info2.file_size:
+                return []
+
+            # Binary files skip difflib entirely
+            if not (self._is_text_member(zip1, info1) and
+                    self._is_text_member(zip2, info2)):
+                return BINARY_DIFF
+
+            # Read just this file from each backup
+            lines1 = self.read_member_lines(zip1, info1)
+            lines2 = self.read_member_lines(zip2, info2)
+            fromfile = f'{source_backup}/{file_path}'
+            tofile = f'{compare_backup}/{file_path}'
+
+            # Large files are too slow to diff in full
+            if max(info1.file_size, info2.file_size) > DIFF_MAX_SIZE:
+                return self.get_first_difference(lines1, lines2, fromfile, tofile)
 
             # Generate diff
-            import difflib
             diff = difflib.unified_diff(
                 lines1, lines2,
-                fromfile=f'{source_backup}/{file_path}',
-                tofile=f'{compare_backup}/{file_path}',
+                fromfile=fromfile,
+                tofile=tofile,
                 lineterm=''
             )
-
-            # Clean up temporary directories
-            shutil.rmtree(temp_source)
-            shutil.rmtree(temp_compare)
-
             return list(diff)
 
-        except Exception as e:
-            # Clean up on error
-            for temp_dir in [os.path.join(self.target_dir, "temp_diff_source"),
-                             os.path.join(self.target_dir, "temp_diff_compare")]:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
+        except Exception:
             return None
 
-    def add_diff_to_widget(self, text_widget, diff_content):
-        """Add diff content to text widget with syntax highlighting"""
+    def get_first_difference(self, lines1, lines2, fromfile, tofile):
+        """Summarize changes as a diff of just the first differing line"""
+        for index, (line1, line2) in enumerate(itertools.zip_longest(lines1, lines2)):
+            if line1 != line2:
+                break
+        else:
+            return []
+
+        diff = [f'--- {fromfile}', f'+++ {tofile}',
+                f'@@ -{index + 1} +{index + 1} @@ first difference only (file too large for a full diff)']
+        if line1 is not None:
+            diff.append(f'-{line1}')
+        if line2 is not None:
+            diff.append(f'+{line2}')
+        return diff
+
+    def _is_text_member(self, zipf, member):
+        """Treat a zip member as text unless its first bytes contain a NUL"""
+        with zipf.open(member) as f:
+            return b'\x00' not in f.read(SNIFF_SIZE)
+
+    def read_member_lines(self, zipf, member):
+        """Read a zip member as text lines without extracting it"""
+        with zipf.open(member) as f:
+            text = io.TextIOWrapper(f, encoding='utf-8', errors='ignore')
+            return text.readlines()
+
+    def format_diff_lines(self, lines, diff_content):
+        """Append diff content to a list of result lines, marking each line's kind"""
         for line in diff_content:
-            if line.startswith('+'):
-                # Added line - green background
-                text_widget.append(f"➕ {line[1:]}")
-            elif line.startswith('-'):
-                # Removed line - red background
-                text_widget.append(f"➖ {line[1:]}")
-            elif line.startswith('@'):
-                # Diff header - blue
-                text_widget.append(f"📍 {line}")
-            elif line.startswith('---') or line.startswith('+++'):
-                # File headers - gray
-                text_widget.append(f"📄 {line}")
+            first = line[:1]
+            if first == '+':
+                # Added line
+                lines.append(f"➕ {line[1:]}")
+            elif first == '-':
+                # Removed line
+                lines.append(f"➖ {line[1:]}")
+            elif first == '@':
+                # Diff header
+                lines.append(f"📍 {line}")
             else:
                 # Context lines - normal
-                text_widget.append(f"  {line}")
+                lines.append(f"  {line}")
 
     def create_tooltip(self, widget, text):
         """Create a tooltip for a widget"""
@@ -1147,14 +1914,7 @@ class BackupRestoreApp(QMainWindow):
         """Open a directory in file explorer"""
         try:
             if os.path.exists(path):
-                if os.name == 'nt':  # Windows
-                    os.startfile(path)
-                elif os.name == 'posix':  # macOS and Linux
-                    import subprocess
-                    subprocess.run(['open', path] if sys.platform ==
-                                   'darwin' else ['xdg-open', path])
-                else:
-                    QMessageBox.information(self, "Info", f"Path: {path}")
+                self._open_path(path)
             else:
                 QMessageBox.critical(
                     self, "Error", f"Path does not exist: {path}")
@@ -1190,8 +1950,12 @@ class BackupRestoreApp(QMainWindow):
 
         # Start restore in separate thread
         self.restore_thread = RestoreThread(backup_path, original_source_dir)
-        self.restore_thread.restore_completed.connect(self.restore_completed)
-        self.restore_thread.restore_failed.connect(self.restore_failed)
+        self.restore_thread.restore_completed.connect(
+            self.restore_completed, Qt.QueuedConnection)
+        self.restore_thread.restore_failed.connect(
+            self.restore_failed, Qt.QueuedConnection)
+        self.restore_thread.progress.connect(
+            self.update_progress, Qt.QueuedConnection)
         self.restore_thread.start()
 
     def restore_completed(self, source_dir):
@@ -1216,20 +1980,29 @@ class BackupRestoreApp(QMainWindow):
                                       QMessageBox.Yes | QMessageBox.No)
         if result == QMessageBox.Yes:
             try:
-                # Delete the backup file
+                # Delete the backup file, closing any pooled handle first
+                self._zip_pool.discard(backup_path)
                 os.remove(backup_path)
-
-                # Delete the associated hash file
-                hash_file_path = backup_path.replace('.zip', '_hashes.json')
-                if os.path.exists(hash_file_path):
-                    os.remove(hash_file_path)
-
-                # Delete the associated notes file
-                notes_file_path = backup_path.replace('.zip', '_notes.txt')
-                if os.path.exists(notes_file_path):
-                    os.remove(notes_file_path)
-
-                self.load_backups()
+                self._notes_cache.pop(backup_path, None)
+                self._srcdir_cache.pop(backup_path, None)
+                self._listed_names.discard(os.path.basename(backup_path))
+
+                # Delete the associated hash, source directory and notes files
+                for suffix in ('_hashes.json', '_source.txt', '_notes.txt'):
+                    sidecar_path = backup_path.replace('.zip', suffix)
+                    if self._file_exists(sidecar_path):
+                        os.remove(sidecar_path)
+                        self._listed_names.discard(os.path.basename(sidecar_path))
+
+                # Remove just this backup from the list and dropdowns
+                row = self.backup_model.row_for_path(backup_path)
+                if row >= 0:
+                    self.backup_model.removeRow(row)
+                backup_name = os.path.basename(backup_path)
+                for combo in (self.source_backup_combo, self.compare_backup_combo):
+                    index = combo.findText(backup_name)
+                    if index >= 0:
+                        combo.removeItem(index)
                 QMessageBox.information(
                     self, "Success", "Backup deleted successfully")
             except Exception as e:
@@ -1261,8 +2034,11 @@ class BackupRestoreApp(QMainWindow):
         self.compare_thread = CompareThread(
             source_backup, compare_backup, self.target_dir)
         self.compare_thread.compare_completed.connect(
-            self.show_comparison_results)
-        self.compare_thread.compare_failed.connect(self.comparison_failed)
+            self.show_comparison_results, Qt.QueuedConnection)
+        self.compare_thread.compare_failed.connect(
+            self.comparison_failed, Qt.QueuedConnection)
+        self.compare_thread.progress.connect(
+            self.update_progress, Qt.QueuedConnection)
         self.compare_thread.start()
 
     def show_comparison_results(self, differences, source_backup, compare_backup):
@@ -1276,38 +2052,16 @@ class BackupRestoreApp(QMainWindow):
             f"🔍 Comparison Results: {source_backup} vs {compare_backup}")
 
         # Clear existing content
-        for i in reversed(range(self.comparison_content_layout.count())):
-            widget = self.comparison_content_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        while True:
+            item = self.comparison_content_layout.takeAt(0)
+            if item is None:
+                break
+            if item.widget():
+                item.widget().deleteLater()
 
         # Create tab widget for results
         results_tab_widget = QTabWidget()
-        results_tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 2px solid #bdc3c7;
-                border-radius: 6px;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #ecf0f1;
-                color: #2c3e50;
-                padding: 6px 16px;
-                margin-right: 1px;
-                border-top-left-radius: 3px;
-                border-top-right-radius: 3px;
-                font-weight: bold;
-                font-size: 11px;
-                min-width: 100px;
-            }
-            QTabBar::tab:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QTabBar::tab:hover {
-                background-color: #bdc3c7;
-            }
-        """)
+        results_tab_widget.setObjectName("resultsTabs")
 
         # Create tabs for each category
         categories = [
@@ -1322,53 +2076,39 @@ class BackupRestoreApp(QMainWindow):
             text_widget = QTextEdit()
             text_widget.setReadOnly(True)
             text_widget.setAcceptRichText(True)
-            text_widget.setStyleSheet(f"""
-                QTextEdit {{
-                    border: none;
-                    background-color: white;
-                    color: #2c3e50;
-                    font-family: 'Consolas', 'Monaco', monospace;
-                    font-size: 13px;
-                    padding: 10px;
-                }}
-            """)
-
-            # Add files to text widget
+            text_widget.setUndoRedoEnabled(False)
+            text_widget.setProperty("class", "results")
+
+            # Collect the tab's lines and set them in one call, so the
+            # document is laid out once rather than once per line
+            lines = []
             files = differences[key]
             if files:
                 if key == 'modified':
-                    # For modified files, show detailed diff for .cs files
-                    for file in sorted(files):
-                        text_widget.append(f"📄 {file}")
-                        # Check if it's a text file by extension
-                        text_extensions = ['.txt', '.cs', '.py', '.js', '.html', '.css', '.xml', '.json', '.md', '.log', '.ini', '.cfg', '.conf', '.yml', '.yaml', '.sql', '.sh', '.bat', '.ps1', '.java', '.cpp', '.c', '.h', '.hpp', '.php', '.rb', '.go', '.rs', '.swift', '.kt', '.scala', '.ts', '.tsx', '.jsx', '.vue', '.svelte']
-                        if any(file.lower().endswith(ext) for ext in text_extensions):
-                            # Get diff content for text files
-                            diff_content = self.get_file_diff(
-                                source_backup, compare_backup, file)
-                            if diff_content:
-                                text_widget.append("")
-                                text_widget.append("Changes:")
-                                text_widget.append("")
+                    # For modified files, show detailed diff for text files,
+                    # opening both backups once for all of them
+                    sorted_files = sorted(files)
+                    with self._open_zips(source_backup, compare_backup) as (zip1, zip2):
+                        for file in sorted_files:
+                            lines.append(f"📄 {file}")
+                            # Get diff content; binary files are detected from their contents
+                            diff_content = self._diff_one(
+                                zip1, zip2, file, source_backup, compare_backup)
+                            if diff_content is BINARY_DIFF:
+                                lines.extend(("  (binary file — diff not shown)", ""))
+                            elif diff_content:
+                                lines.extend(("", "Changes:", ""))
                                 # Add diff content with syntax highlighting
-                                self.add_diff_to_widget(
-                                    text_widget, diff_content)
-                                text_widget.append("")
-                                text_widget.append("─" * 50)
-                                text_widget.append("")
+                                self.format_diff_lines(lines, diff_content)
+                                lines.extend(("", "─" * 50, ""))
                             else:
-                                text_widget.append("  (No differences found)")
-                                text_widget.append("")
-                        else:
-                            text_widget.append(
-                                "  (Binary or non-text file - diff not shown)")
-                            text_widget.append("")
+                                lines.extend(("  (No differences found)", ""))
                 else:
                     # For other categories, just show file names
-                    for file in sorted(files):
-                        text_widget.append(file)
+                    lines.extend(sorted(files))
             else:
-                text_widget.append("No files in this category.")
+                lines.append("No files in this category.")
+            text_widget.setPlainText("\n".join(lines))
 
             results_tab_widget.addTab(text_widget, title)
 
@@ -1377,8 +2117,7 @@ class BackupRestoreApp(QMainWindow):
         # Add summary
         summary_text = f"Summary: {len(differences['added'])} added, {len(differences['removed'])} removed, {len(differences['modified'])} modified, {len(differences['unchanged'])} unchanged"
         summary_label = QLabel(summary_text)
-        summary_label.setStyleSheet(
-            "font-weight: bold; font-size: 14px; padding: 10px; background-color: #ecf0f1; border-radius: 4px; color: #2c3e50;")
+        summary_label.setObjectName("comparisonSummary")
         self.comparison_content_layout.addWidget(summary_label)
 
         # Switch to comparison tab